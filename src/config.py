@@ -1,10 +1,13 @@
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass
 class ProcessingConfig:
     input_directory: str = "/app/input"
     output_directory: str = "/app/output"
     header_footer_margin: int = 50
+    parallel_page_threshold: int = 50
+    max_workers: Optional[int] = None
 
 @dataclass
 class ClassificationConfig:
@@ -1,19 +1,34 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any
+import sys
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to regular ones
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class PositionInfo:
     x0: float; y0: float; x1: float; y1: float
 
-@dataclass
+@dataclass(**_SLOTS)
 class FontMetadata:
     size: float; family: str; weight: str; style: str; is_bold: bool
+    relative_size_rank: Optional[int] = field(default=None, compare=False, repr=False)
 
-@dataclass
+@dataclass(**_SLOTS)
 class TextBlock:
     text: str; page_number: int; font_metadata: FontMetadata; position: PositionInfo
     block_id: int
     is_in_table: bool = False
+    _lower_cache: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def text_lower(self) -> str:
+        # Lowercased text is compared by several filters, so compute it once per text value;
+        # keying the cache on the text object keeps it correct if .text is reassigned
+        cache = self._lower_cache
+        if cache is None or cache[0] is not self.text:
+            cache = self._lower_cache = (self.text, self.text.lower())
+        return cache[1]
 
 @dataclass
 class HeadingCandidate:
@@ -22,6 +37,8 @@ class HeadingCandidate:
     @property
     def text(self) -> str: return self.text_block.text
     @property
+    def text_lower(self) -> str: return self.text_block.text_lower
+    @property
     def page(self) -> int: return self.text_block.page_number
 
 @dataclass
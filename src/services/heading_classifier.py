@@ -4,6 +4,13 @@ from typing import List
 from ..config import ConfigManager
 from ..models.data_models import TextBlock, HeadingCandidate
 
+_DOT_LEADER_PAGE_RE = re.compile(r'\.{3,}\s*\d+\s*$')
+_VERSION_LINE_RE = re.compile(r'^\d+(\.\d+)?\s+\d{1,2}\s+[A-Z]{3,}\s+\d{4}')
+_PAGE_NUMBER_RE = re.compile(r'page \d+|\d+', re.IGNORECASE)
+_NUMBERED_H1_RE = re.compile(r'^\d+\.\s')
+_NUMBERED_H2_RE = re.compile(r'^\d+\.\d+\s')
+_MAIN_HEADINGS = frozenset({"revision history", "table of contents", "acknowledgements", "references"})
+
 class HeadingClassifier:
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager.get_classification_config()
@@ -16,14 +23,14 @@ class HeadingClassifier:
         toc_pages = set()
         for b in blocks:
             t = b.text.strip()
-            if re.search(r'\.{3,}\s*\d+\s*$', t):
+            if _DOT_LEADER_PAGE_RE.search(t):
                 toc_pages.add(b.page_number)
-            elif "table of contents" in t.lower():
+            elif "table of contents" in b.text_lower:
                 toc_pages.add(b.page_number)
 
         # Step 2: Detect Revision History pages
         revision_pages = set(
-            b.page_number for b in blocks if b.text.strip().lower() == "revision history"
+            b.page_number for b in blocks if b.text_lower.strip() == "revision history"
         )
 
         # Median size calculation (content only)
@@ -39,23 +46,22 @@ class HeadingClassifier:
             txt = block.text.strip()
 
             # Ignore obvious pseudo-headings (version lines, page numbers, ToC lines)
-            if re.match(r'^\d+(\.\d+)?\s+\d{1,2}\s+[A-Z]{3,}\s+\d{4}', txt):
+            if _VERSION_LINE_RE.match(txt):
                 continue
-            if re.search(r'\.{3,}\s*\d+\s*$', txt):  # dot leaders + page num
+            if _DOT_LEADER_PAGE_RE.search(txt):  # dot leaders + page num
                 continue
-            if re.fullmatch(r'page \d+|\d+', txt, re.I):
+            if _PAGE_NUMBER_RE.fullmatch(txt):
                 continue
             if len(txt) < 2:
                 continue
 
-            level = self._get_heading_level(block, median_size)
+            level = self._get_heading_level(block, txt, median_size)
             if level in ("H1", "H2"):
                 candidates.append(HeadingCandidate(text_block=block, level=level))
 
         return candidates
 
-    def _get_heading_level(self, block: TextBlock, median_size: float) -> str:
-        txt = block.text.strip()
+    def _get_heading_level(self, block: TextBlock, txt: str, median_size: float) -> str:
         font_size = block.font_metadata.size
         is_bold = block.font_metadata.is_bold
         word_count = len(txt.split())
@@ -66,13 +72,12 @@ class HeadingClassifier:
         size_ratio = font_size / median_size if median_size > 0 else 1.0
 
         # Numbered pattern (e.g. 1. Introduction)
-        if re.match(r'^\d+\.\s', txt):
+        if _NUMBERED_H1_RE.match(txt):
             return "H1"
-        if re.match(r'^\d+\.\d+\s', txt):
+        if _NUMBERED_H2_RE.match(txt):
             return "H2"
         # Unnumbered but matches common main headings
-        main_headings = {"revision history", "table of contents", "acknowledgements", "references"}
-        if txt.lower() in main_headings and size_ratio > 1.1:
+        if size_ratio > 1.1 and block.text_lower.strip() in _MAIN_HEADINGS:
             return "H1"
         if is_bold and size_ratio > 1.1:
             return "H2"
@@ -1,14 +1,14 @@
 import fitz
 import logging
-from typing import List
+from typing import List, Optional
 from ..config import ConfigManager
 from ..services.text_extractor import TextExtractor
 from ..exceptions import PDFParsingError
 from ..models.data_models import TextBlock
 
 class PDFProcessor:
-    def __init__(self, config_manager: ConfigManager):
-        self.text_extractor = TextExtractor(config_manager)
+    def __init__(self, config_manager: ConfigManager, text_extractor: Optional[TextExtractor] = None):
+        self.text_extractor = text_extractor or TextExtractor(config_manager)
         self.logger = logging.getLogger(__name__)
 
     def process_pdf(self, pdf_path: str) -> List[TextBlock]:
@@ -17,11 +17,10 @@ class PDFProcessor:
         except Exception as e:
             raise PDFParsingError(f"Failed to open or parse PDF {pdf_path}: {e}")
 
-        if doc.is_encrypted:
-            self.logger.error(f"PDF is encrypted: {pdf_path}")
+        try:
+            if doc.is_encrypted:
+                self.logger.error(f"PDF is encrypted: {pdf_path}")
+                return []
+            return self.text_extractor.extract_clean_blocks(doc)
+        finally:
             doc.close()
-            return []
-        
-        all_blocks = self.text_extractor.extract_clean_blocks(doc)
-        doc.close()
-        return all_blocks
@@ -1,94 +1,157 @@
 import fitz
+import multiprocessing
+import os
 import re
-from typing import List, Tuple
+import sys
+from typing import Iterable, Iterator, List, Tuple
 from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 
 from ..models.data_models import TextBlock, FontMetadata, PositionInfo
 from ..config import ConfigManager
 
+_FONT_STYLE_SUFFIX_RE = re.compile(r'-(bold|italic|oblique|regular|medium|black)', re.IGNORECASE)
+_PAGE_NUMBER_RE = re.compile(r'page \d+|\d+', re.IGNORECASE)
+_TOC_LEADER_RE = re.compile(r'(\.|\s){4,}\s*\d+$')
+
+# The flags that actually affect span output; equivalent to the previous ~TEXT_PRESERVE_IMAGES
+_TEXT_FLAGS = (
+    (fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES)
+    | fitz.TEXT_INHIBIT_SPACES | fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_SPANS
+)
+
+# Raw span record: (page_number, x0, y0, x1, y1, text, font_size, font_name).
+# Plain tuples keep the per-span cost low; TextBlocks are only built for reconstructed lines.
+SpanRecord = Tuple[int, float, float, float, float, str, float, str]
+_READING_ORDER_KEY = itemgetter(0, 2, 1)  # (page_number, y0, x0)
+
+# Each worker reopens the PDF, so only start one per this many pages
+_MIN_PAGES_PER_WORKER = 16
+
+def _available_cpus() -> int:
+    # Respect CPU affinity (e.g. container cpusets) where the platform exposes it
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+@lru_cache(maxsize=1024)
+def _normalize_font(font_name: str) -> Tuple[str, str, str, bool]:
+    # A document only uses a handful of distinct font names, so the whole result is cached per name
+    if not isinstance(font_name, str): font_name = "Unknown"
+    lower = font_name.lower()
+    is_bold = "bold" in lower or "black" in lower
+    weight = "bold" if is_bold else "normal"
+    style = "italic" if "italic" in lower or "oblique" in lower else "normal"
+    # Interned so blocks sharing a family share one string object
+    family = sys.intern(_FONT_STYLE_SUFFIX_RE.sub('', font_name).split(',')[0])
+    return family, weight, style, is_bold
+
+def _iter_page_spans(doc: fitz.Document, page_numbers: Iterable[int]) -> Iterator[SpanRecord]:
+    for page_num in page_numbers:
+        # Without TEXT_PRESERVE_IMAGES every returned block is a text block
+        for b in doc[page_num].get_text("dict", flags=_TEXT_FLAGS)["blocks"]:
+            for l in b['lines']:
+                for s in l['spans']:
+                    text = s['text'].strip()
+                    if not text: continue
+                    x0, y0, x1, y1 = s['bbox']
+                    yield (page_num, x0, y0, x1, y1, text, s['size'], s['font'])
+
+def _iter_page_spans_from_file(page_range: Tuple[str, int, int]) -> Iterator[SpanRecord]:
+    pdf_path, start, end = page_range
+    doc = fitz.open(pdf_path)
+    try:
+        yield from _iter_page_spans(doc, range(start, end))
+    finally:
+        doc.close()
+
+def _extract_page_range(page_range: Tuple[str, int, int]) -> List[SpanRecord]:
+    # Pool worker entry point; plain tuples pickle much faster than dataclass instances
+    return list(_iter_page_spans_from_file(page_range))
+
 class TextExtractor:
     def __init__(self, config_manager: ConfigManager):
         self.proc_cfg = config_manager.get_processing_config()
-
-    def _normalize_font(self, font_name: str) -> Tuple[str, str, str, bool]:
-        if not isinstance(font_name, str): font_name = "Unknown"
-        lower = font_name.lower()
-        is_bold = "bold" in lower or "black" in lower
-        weight = "bold" if is_bold else "normal"
-        style = "italic" if "italic" in lower or "oblique" in lower else "normal"
-        family = re.sub(r'-(bold|italic|oblique|regular|medium|black)', '', font_name, flags=re.IGNORECASE).split(',')[0]
-        return family, weight, style, is_bold
+        # Header/footer bands on a US Letter height page, used in the per-span filter loop
+        self._hf_top = self.proc_cfg.header_footer_margin
+        self._hf_bottom = 792 - self.proc_cfg.header_footer_margin
 
     def extract_clean_blocks(self, doc: fitz.Document) -> List[TextBlock]:
-        raw_spans = []
-        block_counter = 0
-        for page_num, page in enumerate(doc):
-            blocks_data = page.get_text("dict", flags=~fitz.TEXT_PRESERVE_IMAGES)["blocks"]
-            for b in blocks_data:
-                if b.get('type') == 0:
-                    for l in b.get("lines", []):
-                        for s in l.get("spans", []):
-                            text = s['text'].strip()
-                            if not text: continue
-                            bbox = s['bbox']
-                            family, weight, style, is_bold = self._normalize_font(s['font'])
-                            raw_spans.append(TextBlock(
-                                block_id=block_counter,
-                                text=text, page_number=page_num,
-                                font_metadata=FontMetadata(s['size'], family, weight, style, is_bold),
-                                position=PositionInfo(bbox[0], bbox[1], bbox[2], bbox[3])
-                            ))
-                            block_counter += 1
+        # Header/footer and TOC filtering need document-wide statistics, so materialize here
+        raw_spans = list(self.iter_spans(doc))
         filtered_spans = self._filter_spans(raw_spans, len(doc))
         clean_blocks = self._reconstruct_blocks_from_spans(filtered_spans)
         return clean_blocks
 
-    def _filter_spans(self, spans: List[TextBlock], page_count: int) -> List[TextBlock]:
+    def iter_spans(self, doc: fitz.Document) -> Iterator[SpanRecord]:
+        page_count = len(doc)
+        if page_count > self.proc_cfg.parallel_page_threshold and doc.name and os.path.isfile(doc.name):
+            yield from self._iter_spans_parallel(doc.name, page_count)
+        else:
+            yield from _iter_page_spans(doc, range(page_count))
+
+    def _iter_spans_parallel(self, pdf_path: str, page_count: int) -> Iterator[SpanRecord]:
+        # PyMuPDF is not thread-safe, so each worker process reopens the file for its own page range
+        workers = min(self.proc_cfg.max_workers or _available_cpus(), page_count // _MIN_PAGES_PER_WORKER)
+        if workers < 2:
+            yield from _iter_page_spans_from_file((pdf_path, 0, page_count))
+            return
+        step = -(-page_count // workers)
+        ranges = [(pdf_path, start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        with multiprocessing.Pool(len(ranges)) as pool:
+            for chunk in pool.imap(_extract_page_range, ranges):
+                yield from chunk
+
+    def _filter_spans(self, spans: List[SpanRecord], page_count: int) -> List[SpanRecord]:
         toc_pages = self._find_toc_pages(spans)
-        hf_texts = defaultdict(list)
+        hf_pages = defaultdict(set)
         if page_count > 2:
-            for span in spans:
-                if span.page_number > 0 and span.page_number not in toc_pages:
-                    if span.position.y0 < self.proc_cfg.header_footer_margin or span.position.y1 > (792 - self.proc_cfg.header_footer_margin):
-                        hf_texts[span.text.lower()].append(span.page_number)
-        common_hf_texts = {text for text, pages in hf_texts.items() if len(set(pages)) > page_count / 3}
-        final_spans = []
-        for span in spans:
-            if span.page_number in toc_pages: continue
-            if span.text.lower() in common_hf_texts: continue
-            if re.fullmatch(r'page \d+|\d+', span.text, re.I): continue
-            final_spans.append(span)
-        return final_spans
+            top, bottom = self._hf_top, self._hf_bottom
+            for page, _, y0, _, y1, text, _, _ in spans:
+                if page > 0 and page not in toc_pages:
+                    if y0 < top or y1 > bottom:
+                        hf_pages[text.lower()].add(page)
+        common_hf_texts = {text for text, pages in hf_pages.items() if len(pages) > page_count / 3}
+        return [
+            span for span in spans
+            if span[0] not in toc_pages
+            and not (common_hf_texts and span[5].lower() in common_hf_texts)
+            and not _PAGE_NUMBER_RE.fullmatch(span[5])
+        ]
 
-    def _find_toc_pages(self, spans: List[TextBlock]) -> set:
+    def _find_toc_pages(self, spans: List[SpanRecord]) -> set:
         toc_pages = set()
         page_toc_counts = defaultdict(int)
         for span in spans:
-            if re.search(r'(\.|\s){4,}\s*\d+$', span.text):
-                page_toc_counts[span.page_number] += 1
+            text = span[5]
+            # A TOC entry must end in a page number; checking that first skips the regex for most spans
+            if text[-1].isdigit() and _TOC_LEADER_RE.search(text):
+                page_toc_counts[span[0]] += 1
         for page, count in page_toc_counts.items():
             if count > 3:
                 toc_pages.add(page)
         return toc_pages
 
-    def _reconstruct_blocks_from_spans(self, spans: List[TextBlock]) -> List[TextBlock]:
+    def _reconstruct_blocks_from_spans(self, spans: List[SpanRecord]) -> List[TextBlock]:
         if not spans: return []
-        lines = defaultdict(list)
-        for span in sorted(spans, key=lambda s: (s.page_number, s.position.y0, s.position.x0)):
-            lines[(span.page_number, round(span.position.y0 / 5))].append(span)
         blocks = []
         block_counter = 0
-        for line_spans in sorted(lines.values(), key=lambda s: (s[0].page_number, s[0].position.y0)):
-            text = " ".join(s.text for s in line_spans)
-            pos = PositionInfo(
-                x0=min(s.position.x0 for s in line_spans), y0=min(s.position.y0 for s in line_spans),
-                x1=max(s.position.x1 for s in line_spans), y1=max(s.position.y1 for s in line_spans)
-            )
+        # In (page, y0, x0) order every line key forms one contiguous run, already in reading order
+        ordered = sorted(spans, key=_READING_ORDER_KEY)
+        for _, group in groupby(ordered, key=lambda s: (s[0], round(s[2] / 5))):
+            line_spans = list(group)
+            page_num, _, _, _, _, _, size, font_name = line_spans[0]
+            family, weight, style, is_bold = _normalize_font(font_name)
+            _, x0s, y0s, x1s, y1s, texts, _, _ = zip(*line_spans)
+            text = " ".join(texts)
+            pos = PositionInfo(x0=min(x0s), y0=min(y0s), x1=max(x1s), y1=max(y1s))
             blocks.append(TextBlock(
                 block_id=block_counter,
                 text=text,
-                page_number=line_spans[0].page_number,
-                font_metadata=line_spans[0].font_metadata,
+                page_number=page_num,
+                font_metadata=FontMetadata(size, family, weight, style, is_bold),
                 position=pos
             ))
             block_counter += 1
@@ -1,21 +1,24 @@
-from typing import List
-from ..models.data_models import TextBlock, HeadingCandidate
+from itertools import takewhile
+from operator import attrgetter
+
+_FONT_SIZE_KEY = attrgetter('font_metadata.size')
 
 class TitleDetector:
     def __init__(self, config_manager):
         pass
 
     def detect_title(self, candidates, all_blocks):
-        # Allow largest text block(s) from page 0 and 1
-        first_blocks = [b for b in all_blocks if b.page_number in (0, 1)]
+        # Allow largest text block(s) from page 0 and 1; blocks arrive in page order,
+        # so stop at the first block past page 1 instead of scanning the whole document
+        first_blocks = list(takewhile(lambda b: b.page_number <= 1, all_blocks))
         if not first_blocks:
             return ""
-        first_blocks.sort(key=lambda b: b.font_metadata.size, reverse=True)
-        max_size = first_blocks[0].font_metadata.size
+        largest = max(first_blocks, key=_FONT_SIZE_KEY)
+        max_size = largest.font_metadata.size
 
-        # Include all large-font lines (handles "Overview Foundation Level Extensions" as two lines)
-        titles = [
-            b.text.strip() for b in first_blocks
-            if abs(b.font_metadata.size - max_size) < 1.0 and len(b.text.strip()) > 5
-        ]
-        return "  ".join(titles) if titles else first_blocks[0].text.strip()
+        # Include all large-font lines (handles "Overview Foundation Level Extensions" as two lines),
+        # largest first; only this short list needs sorting
+        title_blocks = [b for b in first_blocks if abs(b.font_metadata.size - max_size) < 1.0]
+        title_blocks.sort(key=_FONT_SIZE_KEY, reverse=True)
+        titles = [t for t in (b.text.strip() for b in title_blocks) if len(t) > 5]
+        return "  ".join(titles) if titles else largest.text.strip()
@@ -2,6 +2,11 @@ import re
 from typing import List, Optional
 from ..models.data_models import TextBlock, HeadingCandidate
 
+# e.g. "2.3 Learning Objectives .......... 7"
+_DOTTED_NUMBERED_RE = re.compile(r'^((?:[0-9]+[.])+\s*)?(.+?)\.{3,}\s*(\d+)$')
+# e.g. "Revision History .......... 3"
+_DOTTED_PLAIN_RE = re.compile(r'^(.+?)\.{3,}\s*(\d+)$')
+
 class TOCExtractor:
     def __init__(self, config_manager):
         self.config = config_manager.get_classification_config()
@@ -10,52 +15,43 @@ class TOCExtractor:
         # Find the page containing "Table of Contents"
         toc_page = None
         for block in blocks:
-            if "table of contents" in block.text.strip().lower():
+            if "table of contents" in block.text_lower:
                 toc_page = block.page_number
                 break
         if toc_page is None:
             return None  # No TOC found
 
         toc_headings = []
+        last_page = toc_page + 1
         for block in blocks:
-            if block.page_number in (toc_page, toc_page + 1):
+            pn = block.page_number
+            # Blocks arrive in page order, so nothing past the page after the TOC can match
+            if pn > last_page:
+                break
+            if pn >= toc_page:
                 txt = block.text.strip()
-                # Match e.g. "2.3 Learning Objectives .......... 7"
-                m = re.match(r'^((?:[0-9]+[.])+\s*)?(.+?)\.{3,}\s*(\d+)$', txt)
+                m = _DOTTED_NUMBERED_RE.match(txt)
                 if m:
-                    heading_txt = m.group(2).strip()
-                    page_num = int(m.group(3))
-                    level = self.detect_level(m.group(1))
                     toc_headings.append(HeadingCandidate(
-                        text_block=block, level=level, page=page_num
+                        text_block=block, level=self.detect_level(m.group(1)), page=int(m.group(3))
                     ))
                 else:
-                    # For cases like "Revision History .......... 3"
-                    m2 = re.match(r'^(.+?)\.{3,}\s*(\d+)$', txt)
+                    m2 = _DOTTED_PLAIN_RE.match(txt)
                     if m2:
-                        heading_txt = m2.group(1).strip()
-                        page_num = int(m2.group(2))
-                        level = "H1"
                         toc_headings.append(HeadingCandidate(
-                            text_block=block, level=level, page=page_num
+                            text_block=block, level="H1", page=int(m2.group(2))
                         ))
         if toc_headings:
-            # Deduplicate by heading text
-            seen = set()
-            result = []
+            # Deduplicate by heading text, keeping the first occurrence in order
+            unique = {}
             for h in toc_headings:
-                if h.text_block.text not in seen:
-                    result.append(h)
-                    seen.add(h.text_block.text)
-            return result
+                unique.setdefault(h.text_block.text, h)
+            return list(unique.values())
         return None
 
     def detect_level(self, numpart):
-        if numpart is None:
+        # Count dots once: none = H1, "1." / "2.3" / "2.3." = H2, deeper numbering = H3
+        dots = numpart.count('.') if numpart else 0
+        if dots == 0:
             return "H1"
-        # Count dots: "2.3" = H2, "1." = H1
-        if numpart.count('.') > 1:
-            return "H2"
-        if numpart.count('.') == 1:
-            return "H2"
-        return "H1"
+        return "H2" if dots <= 2 else "H3"
@@ -1,6 +1,7 @@
 """Comprehensive error handling for PDF outline extraction."""
 
 import logging
+from os.path import basename, splitext
 from typing import Dict, Any, Optional, Callable
 from enum import Enum
 from dataclasses import dataclass
@@ -44,6 +45,14 @@ class ErrorHandler:
             'performance': 0,
             'unknown': 0
         }
+        # Handlers keyed by exception type; subclasses resolve through their MRO
+        self._dispatch = {
+            PDFParsingError: self.handle_pdf_parsing_error,
+            TextExtractionError: self.handle_text_extraction_error,
+            HeadingClassificationError: self.handle_classification_error,
+            JSONGenerationError: self.handle_json_generation_error,
+            PerformanceError: self.handle_performance_error,
+        }
     
     def handle_error(self, error: Exception, context: ErrorContext) -> RecoveryAction:
         """Handle an error and determine recovery action.
@@ -56,29 +65,28 @@ class ErrorHandler:
             RecoveryAction to take
         """
         error_type = type(error).__name__
-        self.logger.error(f"Error in {context.operation}: {error_type} - {str(error)}")
         
-        # Log context information
+        # Log the error with its context information as a single record
+        # (formatting is deferred to logging so it is skipped when ERROR is filtered out)
+        lines = ["Error in %s: %s - %s"]
+        args = [context.operation, error_type, error]
         if context.file_path:
-            self.logger.error(f"File: {context.file_path}")
+            lines.append("File: %s")
+            args.append(context.file_path)
         if context.stage:
-            self.logger.error(f"Stage: {context.stage}")
+            lines.append("Stage: %s")
+            args.append(context.stage)
         if context.additional_info:
-            self.logger.error(f"Additional info: {context.additional_info}")
+            lines.append("Additional info: %s")
+            args.append(context.additional_info)
+        self.logger.error("\n".join(lines), *args)
         
-        # Determine recovery action based on error type
-        if isinstance(error, PDFParsingError):
-            return self.handle_pdf_parsing_error(error, context)
-        elif isinstance(error, TextExtractionError):
-            return self.handle_text_extraction_error(error, context)
-        elif isinstance(error, HeadingClassificationError):
-            return self.handle_classification_error(error, context)
-        elif isinstance(error, JSONGenerationError):
-            return self.handle_json_generation_error(error, context)
-        elif isinstance(error, PerformanceError):
-            return self.handle_performance_error(error, context)
-        else:
-            return self.handle_unknown_error(error, context)
+        # Determine recovery action based on the most specific registered error type
+        for error_class in type(error).__mro__:
+            handler = self._dispatch.get(error_class)
+            if handler is not None:
+                return handler(error, context)
+        return self.handle_unknown_error(error, context)
     
     def handle_pdf_parsing_error(self, error: PDFParsingError, context: ErrorContext) -> RecoveryAction:
         """Handle PDF parsing errors.
@@ -188,7 +196,7 @@ class ErrorHandler:
         self.error_counts['unknown'] += 1
         
         # Log full traceback for debugging
-        self.logger.exception(f"Unknown error in {context.operation}: {str(error)}")
+        self.logger.exception("Unknown error in %s: %s", context.operation, error)
         
         # Try to continue with minimal output
         return RecoveryAction.MINIMAL_OUTPUT
@@ -203,9 +211,7 @@ class ErrorHandler:
         Returns:
             Minimal JSON output
         """
-        from pathlib import Path
-        
-        filename = Path(file_path).stem
+        filename = splitext(basename(file_path))[0]
         
         return {
             "title": f"Error Processing - {filename}",
@@ -231,19 +237,17 @@ class ErrorHandler:
         # Simple font-size based classification
         outline_entries = []
         
-        # Find largest font size
+        # Find largest font size and derive the level thresholds once
         max_font_size = max(block.font_metadata.size for block in text_blocks)
+        h1_min_size = max_font_size * 0.9
+        h2_min_size = max_font_size * 0.8
         
         for block in text_blocks:
+            size = block.font_metadata.size
             # Only include text that's significantly larger than average
-            if block.font_metadata.size >= max_font_size * 0.8:
+            if size >= h2_min_size:
                 # Simple level assignment based on relative size
-                if block.font_metadata.size >= max_font_size * 0.9:
-                    level = "H1"
-                elif block.font_metadata.size >= max_font_size * 0.8:
-                    level = "H2"
-                else:
-                    level = "H3"
+                level = "H1" if size >= h1_min_size else "H2"
                 
                 # Basic text cleaning
                 text = block.text.strip()
@@ -253,9 +257,9 @@ class ErrorHandler:
                         "text": text,
                         "page": block.page_number
                     })
-        
-        # Limit to reasonable number of entries
-        outline_entries = outline_entries[:20]
+                    # Limit to reasonable number of entries
+                    if len(outline_entries) >= 20:
+                        break
         
         return {
             "title": title or (outline_entries[0]["text"] if outline_entries else "Untitled Document"),
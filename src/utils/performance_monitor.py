@@ -1,12 +1,23 @@
 """Performance monitoring utilities for PDF outline extraction."""
 
+import os
+import signal
+import sys
+import threading
 import time
 import psutil
 import gc
 import logging
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from functools import wraps
+from itertools import islice
+
+from ..exceptions import PerformanceError
+
+
+_STATM_PATH = '/proc/self/statm'
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
 
 
 @dataclass
@@ -40,8 +51,10 @@ class PerformanceMonitor:
             max_time_seconds: Maximum processing time in seconds
         """
         self.max_memory_bytes = max_memory_gb * 1024 * 1024 * 1024
+        self.max_memory_mb = max_memory_gb * 1024.0
         self.max_time_seconds = max_time_seconds
         self.logger = logging.getLogger(__name__)
+        self._proc = psutil.Process()
         
     def monitor_processing(self, operation: Callable, *args, **kwargs) -> ProcessingMetrics:
         """Monitor a processing operation.
@@ -59,35 +72,28 @@ class PerformanceMonitor:
         peak_memory = start_memory.rss_mb
         
         try:
-            # Monitor memory during execution
-            def memory_monitor():
-                nonlocal peak_memory
-                current_memory = self.get_memory_stats().rss_mb
-                peak_memory = max(peak_memory, current_memory)
-                
-                # Trigger cleanup if memory usage is high
-                if current_memory > self.max_memory_bytes * 0.8 / (1024 * 1024):
-                    self.trigger_cleanup()
-            
-            # Execute operation with monitoring
             result = operation(*args, **kwargs)
-            memory_monitor()
             
             processing_time = time.time() - start_time
             final_memory = self.get_memory_stats()
+            peak_memory = max(peak_memory, final_memory.rss_mb)
+            
+            # Trigger cleanup if memory usage is high
+            if final_memory.rss_mb > self.max_memory_mb * 0.8:
+                self.trigger_cleanup()
             
             # Check performance constraints
             if processing_time > self.max_time_seconds:
-                self.logger.warning(f"Processing time exceeded limit: {processing_time:.2f}s > {self.max_time_seconds}s")
+                self.logger.warning("Processing time exceeded limit: %.2fs > %ss", processing_time, self.max_time_seconds)
             
-            if peak_memory > self.max_memory_bytes / (1024 * 1024):
-                self.logger.warning(f"Memory usage exceeded limit: {peak_memory:.2f}MB > {self.max_memory_bytes / (1024 * 1024):.2f}MB")
+            if peak_memory > self.max_memory_mb:
+                self.logger.warning("Memory usage exceeded limit: %.2fMB > %.2fMB", peak_memory, self.max_memory_mb)
             
             return ProcessingMetrics(
                 processing_time=processing_time,
                 memory_usage_mb=final_memory.rss_mb,
                 memory_peak_mb=peak_memory,
-                cpu_percent=psutil.cpu_percent(),
+                cpu_percent=psutil.cpu_percent(interval=None),
                 success=True
             )
             
@@ -99,7 +105,7 @@ class PerformanceMonitor:
                 processing_time=processing_time,
                 memory_usage_mb=final_memory.rss_mb,
                 memory_peak_mb=peak_memory,
-                cpu_percent=psutil.cpu_percent(),
+                cpu_percent=psutil.cpu_percent(interval=None),
                 success=False,
                 error_message=str(e)
             )
@@ -110,17 +116,36 @@ class PerformanceMonitor:
         Returns:
             MemoryStats object with current memory information
         """
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        rss_bytes, vms_bytes = self._read_process_memory()
         virtual_memory = psutil.virtual_memory()
         
         return MemoryStats(
-            rss_mb=memory_info.rss / (1024 * 1024),
-            vms_mb=memory_info.vms / (1024 * 1024),
-            percent=process.memory_percent(),
+            rss_mb=rss_bytes / (1024 * 1024),
+            vms_mb=vms_bytes / (1024 * 1024),
+            percent=rss_bytes / virtual_memory.total * 100,
             available_mb=virtual_memory.available / (1024 * 1024)
         )
     
+    def _read_process_memory(self) -> Tuple[int, int]:
+        """Read resident and virtual memory size of the current process.
+        
+        On Linux this parses /proc/self/statm directly, which is much cheaper
+        than going through psutil; other platforms fall back to psutil.
+        
+        Returns:
+            Tuple of (rss_bytes, vms_bytes)
+        """
+        if sys.platform.startswith('linux'):
+            try:
+                with open(_STATM_PATH) as f:
+                    vms_pages, rss_pages = f.read().split()[:2]
+                return int(rss_pages) * _PAGE_SIZE, int(vms_pages) * _PAGE_SIZE
+            except (OSError, ValueError):
+                pass
+        
+        memory_info = self._proc.memory_info()
+        return memory_info.rss, memory_info.vms
+    
     def check_memory_usage(self) -> bool:
         """Check if memory usage is within limits.
         
@@ -128,7 +153,7 @@ class PerformanceMonitor:
             True if memory usage is acceptable
         """
         stats = self.get_memory_stats()
-        return stats.rss_mb < (self.max_memory_bytes / (1024 * 1024)) * 0.9
+        return stats.rss_mb < self.max_memory_mb * 0.9
     
     def trigger_cleanup(self) -> None:
         """Trigger memory cleanup operations."""
@@ -137,11 +162,14 @@ class PerformanceMonitor:
         
         # Log memory stats after cleanup
         stats = self.get_memory_stats()
-        self.logger.info(f"Memory after cleanup: {stats.rss_mb:.2f}MB ({stats.percent:.1f}%)")
+        self.logger.info("Memory after cleanup: %.2fMB (%.1f%%)", stats.rss_mb, stats.percent)
     
     def enforce_timeout(self, max_seconds: int) -> Callable:
         """Decorator to enforce timeout on operations.
         
+        On POSIX systems the operation is interrupted with a PerformanceError
+        once the limit is reached; otherwise an overrun is only logged.
+        
         Args:
             max_seconds: Maximum seconds allowed
             
@@ -153,51 +181,114 @@ class PerformanceMonitor:
             def wrapper(*args, **kwargs):
                 start_time = time.time()
                 
+                # SIGALRM only exists on POSIX and can only be handled in the main thread;
+                # elsewhere the limit is checked after the operation returns
+                use_alarm = (hasattr(signal, 'SIGALRM')
+                             and threading.current_thread() is threading.main_thread())
+                if use_alarm:
+                    # Any timer already running (e.g. an enclosing enforce_timeout) keeps
+                    # its own deadline: the alarm is armed for whichever is due first, an
+                    # earlier timer is handed to its previous handler, and it is re-armed
+                    # with its remaining time once the operation ends
+                    deadline = time.monotonic() + max_seconds
+                    old_deadline = None
+                    armed_for_old = False
+                    
+                    def _arm():
+                        nonlocal armed_for_old
+                        armed_for_old = old_deadline is not None and old_deadline < deadline
+                        due = old_deadline if armed_for_old else deadline
+                        delay = max(due - time.monotonic(), 1e-6)
+                        signal.setitimer(signal.ITIMER_REAL, delay, old_interval if armed_for_old else 0)
+                    
+                    def _take_timer():
+                        # Adopt whatever timer is running as the earlier one, then disarm it
+                        nonlocal old_deadline, old_interval
+                        delay, interval = signal.setitimer(signal.ITIMER_REAL, 0)
+                        if delay:
+                            old_deadline, old_interval = time.monotonic() + delay, interval
+                        else:
+                            old_deadline, old_interval = None, 0
+                    
+                    def _raise_timeout(signum, frame):
+                        if not armed_for_old:
+                            raise PerformanceError(f"Operation timeout after {max_seconds}s")
+                        # The earlier timer fired: deliver it once to its own handler, keep
+                        # its next period (or any timer that handler arms), and resume ours
+                        _take_timer()
+                        if callable(old_handler):
+                            old_handler(signum, frame)
+                            if signal.getitimer(signal.ITIMER_REAL)[0]:
+                                _take_timer()
+                        _arm()
+                    
+                    old_interval = 0
+                    old_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+                    _take_timer()
+                    _arm()
+                
                 try:
                     result = func(*args, **kwargs)
                     
                     elapsed = time.time() - start_time
                     if elapsed > max_seconds:
-                        self.logger.warning(f"Operation took {elapsed:.2f}s, exceeding {max_seconds}s limit")
+                        self.logger.warning("Operation took %.2fs, exceeding %ss limit", elapsed, max_seconds)
                     
                     return result
                     
                 except Exception as e:
                     elapsed = time.time() - start_time
-                    self.logger.error(f"Operation failed after {elapsed:.2f}s: {str(e)}")
+                    self.logger.error("Operation failed after %.2fs: %s", elapsed, e)
                     raise
+                
+                finally:
+                    if use_alarm:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+                        signal.signal(signal.SIGALRM, old_handler)
+                        if old_deadline is not None:
+                            remaining = old_deadline - time.monotonic()
+                            # A timer that came due while disarmed here is dropped rather
+                            # than delivered late; a periodic one resumes its interval
+                            if remaining > 0:
+                                signal.setitimer(signal.ITIMER_REAL, remaining, old_interval)
+                            elif old_interval:
+                                signal.setitimer(signal.ITIMER_REAL, old_interval, old_interval)
             
             return wrapper
         return decorator
     
-    def optimize_batch_processing(self, items: list, batch_size: int = 1000) -> list:
+    def optimize_batch_processing(self, items: Iterable[Any], batch_size: int = 1000) -> Iterator[Any]:
         """Optimize batch processing to prevent memory spikes.
         
+        Items are pulled from the input in batches and yielded as they are
+        processed, so neither the input nor the output is copied into an
+        intermediate list; wrap the call in list() if a list is needed.
+        
         Args:
-            items: List of items to process
+            items: Iterable of items to process
             batch_size: Size of each batch
             
-        Returns:
-            List of processed items
+        Yields:
+            Processed items
         """
-        processed_items = []
+        it = iter(items)
+        progress = 0
         
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
+        while True:
+            batch = list(islice(it, batch_size))
+            if not batch:
+                break
             
             # Process batch
-            processed_batch = self._process_batch(batch)
-            processed_items.extend(processed_batch)
+            yield from self._process_batch(batch)
             
             # Monitor and cleanup after each batch
             if not self.check_memory_usage():
                 self.trigger_cleanup()
             
             # Log progress
-            progress = min(i + batch_size, len(items))
-            self.logger.debug(f"Processed {progress}/{len(items)} items")
-        
-        return processed_items
+            progress += len(batch)
+            self.logger.debug("Processed %d items", progress)
     
     def _process_batch(self, batch: list) -> list:
         """Process a batch of items (placeholder for actual processing).
@@ -224,8 +315,8 @@ class PerformanceMonitor:
             'memory_usage_mb': memory_stats.rss_mb,
             'memory_percent': memory_stats.percent,
             'memory_available_mb': memory_stats.available_mb,
-            'cpu_percent': psutil.cpu_percent(),
-            'memory_limit_mb': self.max_memory_bytes / (1024 * 1024),
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory_limit_mb': self.max_memory_mb,
             'time_limit_seconds': self.max_time_seconds,
-            'within_memory_limit': memory_stats.rss_mb < (self.max_memory_bytes / (1024 * 1024)),
+            'within_memory_limit': memory_stats.rss_mb < self.max_memory_mb,
         }
\ No newline at end of file
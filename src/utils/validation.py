@@ -1,35 +1,80 @@
 """Validation utilities for PDF outline extractor."""
 
 import json
+import os
 import re
+import stat
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 import unicodedata
 
 from ..exceptions import ValidationError
 
 
-class JSONSchemaValidator:
-    """Validates JSON output against the required schema."""
-    
-    REQUIRED_SCHEMA = {
-        "type": "object",
-        "required": ["title", "outline"],
-        "properties": {
-            "title": {"type": "string"},
-            "outline": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "required": ["level", "text", "page"],
-                    "properties": {
-                        "level": {"type": "string", "enum": ["H1", "H2", "H3"]},
-                        "text": {"type": "string"},
-                        "page": {"type": "integer", "minimum": 1}
-                    }
+# Control characters (category Cc) to drop, keeping line breaks and tabs. Cc is
+# a stable category confined to U+0000-U+009F, so scanning Latin-1 covers it
+_CONTROL_CHAR_TABLE = dict.fromkeys(
+    c for c in range(0x100)
+    if unicodedata.category(chr(c)) == 'Cc' and chr(c) not in '\n\r\t'
+)
+
+# Common PDF extraction artifacts removed by UnicodeHandler.clean_extracted_text,
+# applied in order; leading/trailing whitespace is left to the final strip()
+_ARTIFACT_PATTERNS = tuple(re.compile(p) for p in (
+    r'\(\s*(?:-+|-\s*-)?\s*\)',  # Empty parentheses, optionally holding dashes
+    r'\[\s*\]',  # Empty square brackets
+    r'\{\s*\}',  # Empty curly brackets
+    r'^\s*[-•·]\s*',  # Leading bullet points
+))
+_MULTISPACE_RE = re.compile(r'\s{2,}')
+# Printable ASCII that any of the artifact or whitespace passes would change
+# beyond a plain strip(): an opening bracket, a double space or a leading bullet
+_NEEDS_CLEAN_RE = re.compile(r'[(\[{]|  |^ *-')
+# Standalone punctuation left over once the artifacts above are removed
+_JUNK_STRINGS = frozenset({'()', '( )', '(-)', '( - )', '( - - )', '[]', '{}', '-', '•', '·'})
+
+# Output schema enforced by JSONSchemaValidator
+REQUIRED_SCHEMA = {
+    "type": "object",
+    "required": ["title", "outline"],
+    "properties": {
+        "title": {"type": "string"},
+        "outline": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["level", "text", "page"],
+                "properties": {
+                    "level": {"type": "string", "enum": ["H1", "H2", "H3"]},
+                    "text": {"type": "string"},
+                    "page": {"type": "integer", "minimum": 1}
                 }
             }
         }
     }
+}
+
+# Constraints checked by JSONSchemaValidator, extracted once from the schema
+_REQUIRED_FIELDS = tuple(REQUIRED_SCHEMA["required"])
+_REQUIRED_SET = frozenset(_REQUIRED_FIELDS)
+_ENTRY_SCHEMA = REQUIRED_SCHEMA["properties"]["outline"]["items"]
+_ENTRY_REQUIRED_FIELDS = tuple(_ENTRY_SCHEMA["required"])
+_ENTRY_REQUIRED_SET = frozenset(_ENTRY_REQUIRED_FIELDS)
+_LEVEL_SET = frozenset(_ENTRY_SCHEMA["properties"]["level"]["enum"])
+_ENTRY_FIELDS = itemgetter(*_ENTRY_REQUIRED_FIELDS)
+
+# A Unicode letter or digit; str.isalnum() already covers every category L char
+_MEANINGFUL_CHAR_RE = re.compile(r'[^\W_]')
+
+# Script ranges counted by UnicodeHandler.detect_language_hints
+_JAPANESE_RE = re.compile('[\u3040-\u30FF\u4E00-\u9FAF]')  # Hiragana, Katakana, Kanji
+_CYRILLIC_RE = re.compile('[\u0400-\u04FF]')
+
+
+class JSONSchemaValidator:
+    """Validates JSON output against the required schema."""
+    
+    REQUIRED_SCHEMA = REQUIRED_SCHEMA
     
     @staticmethod
     def validate_json_output(data: Dict[str, Any]) -> bool:
@@ -49,24 +94,26 @@ class JSONSchemaValidator:
             if not isinstance(data, dict):
                 raise ValidationError("Output must be a dictionary")
             
-            if "title" not in data:
-                raise ValidationError("Missing required field: title")
+            missing = _REQUIRED_SET - data.keys()
+            if missing:
+                fields = ', '.join(f for f in _REQUIRED_FIELDS if f in missing)
+                noun = "field" if len(missing) == 1 else "fields"
+                raise ValidationError(f"Missing required {noun}: {fields}")
             
-            if "outline" not in data:
-                raise ValidationError("Missing required field: outline")
+            title, outline = data["title"], data["outline"]
             
             # Validate title
-            if not isinstance(data["title"], str):
+            if not isinstance(title, str):
                 raise ValidationError("Title must be a string")
             
-            if not data["title"].strip():
+            if not title.strip():
                 raise ValidationError("Title cannot be empty")
             
             # Validate outline
-            if not isinstance(data["outline"], list):
+            if not isinstance(outline, list):
                 raise ValidationError("Outline must be a list")
             
-            for i, entry in enumerate(data["outline"]):
+            for i, entry in enumerate(outline):
                 JSONSchemaValidator._validate_outline_entry(entry, i)
             
             return True
@@ -83,27 +130,30 @@ class JSONSchemaValidator:
             raise ValidationError(f"Outline entry {index} must be a dictionary")
         
         # Check required fields
-        required_fields = ["level", "text", "page"]
-        for field in required_fields:
-            if field not in entry:
-                raise ValidationError(f"Outline entry {index} missing required field: {field}")
+        try:
+            level, text, page = _ENTRY_FIELDS(entry)
+        except KeyError:
+            missing = _ENTRY_REQUIRED_SET - entry.keys()
+            fields = ', '.join(f for f in _ENTRY_REQUIRED_FIELDS if f in missing)
+            noun = "field" if len(missing) == 1 else "fields"
+            raise ValidationError(f"Outline entry {index} missing required {noun}: {fields}")
         
         # Validate level
-        if entry["level"] not in ["H1", "H2", "H3"]:
-            raise ValidationError(f"Outline entry {index} has invalid level: {entry['level']}")
+        if not isinstance(level, str) or level not in _LEVEL_SET:
+            raise ValidationError(f"Outline entry {index} has invalid level: {level}")
         
         # Validate text
-        if not isinstance(entry["text"], str):
+        if not isinstance(text, str):
             raise ValidationError(f"Outline entry {index} text must be a string")
         
-        if not entry["text"].strip():
+        if not text.strip():
             raise ValidationError(f"Outline entry {index} text cannot be empty")
         
         # Validate page
-        if not isinstance(entry["page"], int):
+        if not isinstance(page, int):
             raise ValidationError(f"Outline entry {index} page must be an integer")
         
-        if entry["page"] < 0:
+        if page < 0:
             raise ValidationError(f"Outline entry {index} page must be non-negative")
 
 
@@ -120,17 +170,23 @@ class UnicodeHandler:
         Returns:
             Normalized text
         """
+        return UnicodeHandler._normalize(text).strip()
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Normalize text like normalize_text, leaving surrounding whitespace."""
         if not text:
             return ""
         
-        # Normalize Unicode to NFC form
-        normalized = unicodedata.normalize('NFC', text)
-        
-        # Remove control characters but keep line breaks
-        cleaned = ''.join(char for char in normalized 
-                         if unicodedata.category(char) != 'Cc' or char in '\n\r\t')
+        # Pure ASCII is already NFC; only control characters need removing
+        if text.isascii():
+            if text.isprintable():
+                return text
+            return text.translate(_CONTROL_CHAR_TABLE)
         
-        return cleaned.strip()
+        # Normalize Unicode to NFC form and remove control characters but keep
+        # line breaks
+        return unicodedata.normalize('NFC', text).translate(_CONTROL_CHAR_TABLE)
     
     @staticmethod
     def clean_extracted_text(text: str) -> str:
@@ -145,32 +201,27 @@ class UnicodeHandler:
         if not text:
             return ""
         
-        # First normalize Unicode
-        cleaned = UnicodeHandler.normalize_text(text)
+        # Printable ASCII with nothing the patterns below could match only
+        # needs its edges trimmed
+        if text.isascii() and text.isprintable() and not _NEEDS_CLEAN_RE.search(text):
+            return text.strip()
+        
+        # First normalize Unicode; the final strip() below trims the edges
+        cleaned = UnicodeHandler._normalize(text)
         
         # Remove common PDF extraction artifacts
-        artifacts_patterns = [
-            r'\(\s*\)',  # Empty parentheses with optional spaces
-            r'\(\s*-\s*-\s*\)',  # Parentheses with dashes
-            r'\(\s*-+\s*\)',  # Parentheses with multiple dashes
-            r'\[\s*\]',  # Empty square brackets
-            r'\{\s*\}',  # Empty curly brackets
-            r'^\s*[-•·]\s*',  # Leading bullet points
-            r'\s+$',  # Trailing whitespace
-            r'^\s+',  # Leading whitespace
-        ]
-        
-        for pattern in artifacts_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
+        for pattern in _ARTIFACT_PATTERNS:
+            cleaned = pattern.sub('', cleaned)
         
         # Normalize multiple spaces to single space
-        cleaned = re.sub(r'\s{2,}', ' ', cleaned)
+        cleaned = _MULTISPACE_RE.sub(' ', cleaned)
         
         # Remove standalone punctuation that might be artifacts
-        if cleaned.strip() in ['()', '( )', '(-)', '( - )', '( - - )', '[]', '{}', '-', '•', '·']:
+        cleaned = cleaned.strip()
+        if cleaned in _JUNK_STRINGS:
             return ""
         
-        return cleaned.strip()
+        return cleaned
     
     @staticmethod
     def is_valid_unicode(text: str) -> bool:
@@ -182,8 +233,11 @@ class UnicodeHandler:
         Returns:
             True if valid Unicode
         """
+        # Only lone surrogates fail to encode; UTF-8 output always decodes
+        if text.isascii():
+            return True
         try:
-            text.encode('utf-8').decode('utf-8')
+            text.encode('utf-8')
             return True
         except UnicodeError:
             return False
@@ -203,24 +257,25 @@ class UnicodeHandler:
         if not text:
             return hints
         
-        # Japanese character detection
-        japanese_chars = sum(1 for char in text if '\u3040' <= char <= '\u309F' or  # Hiragana
-                           '\u30A0' <= char <= '\u30FF' or  # Katakana
-                           '\u4E00' <= char <= '\u9FAF')    # Kanji
+        if text.isascii():
+            return {'latin': 1.0}
+        
+        # Count scripts with C-level scans: Latin-1 via a lossy encode, then
+        # only scan for the other scripts when non-Latin characters remain
+        latin_chars = len(text.encode('latin-1', 'ignore'))
+        other_chars = len(text) - latin_chars
+        japanese_chars = cyrillic_chars = 0
+        if other_chars:
+            cyrillic_chars = _CYRILLIC_RE.subn('', text)[1]
+            if cyrillic_chars < other_chars:
+                japanese_chars = _JAPANESE_RE.subn('', text)[1]
         
         if japanese_chars > 0:
             hints['japanese'] = japanese_chars / len(text)
         
-        # Latin script detection
-        latin_chars = sum(1 for char in text if '\u0000' <= char <= '\u007F' or  # Basic Latin
-                         '\u0080' <= char <= '\u00FF')    # Latin-1 Supplement
-        
         if latin_chars > 0:
             hints['latin'] = latin_chars / len(text)
         
-        # Cyrillic detection
-        cyrillic_chars = sum(1 for char in text if '\u0400' <= char <= '\u04FF')
-        
         if cyrillic_chars > 0:
             hints['cyrillic'] = cyrillic_chars / len(text)
         
@@ -275,8 +330,7 @@ class DataModelValidator:
         
         # Check for reasonable content (not just whitespace or special chars)
         # Use Unicode-aware character checking
-        meaningful_chars = sum(1 for char in text if char.isalnum() or unicodedata.category(char).startswith('L'))
-        if meaningful_chars < 1:
+        if not _MEANINGFUL_CHAR_RE.search(text):
             return False
         
         return True
@@ -291,6 +345,9 @@ class DataModelValidator:
         Returns:
             True if valid
         """
+        # Scores are almost always plain floats; skip the isinstance walk for them
+        if type(score) is float:
+            return 0.0 <= score <= 1.0
         return isinstance(score, (int, float)) and 0.0 <= score <= 1.0
 
 
@@ -306,26 +363,27 @@ def validate_processing_input(file_path: str) -> bool:
     Raises:
         ValidationError: If validation fails
     """
-    import os
-    
     if not file_path:
         raise ValidationError("File path cannot be empty")
     
-    if not os.path.exists(file_path):
+    # One stat() call answers existence, file type and size
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
         raise ValidationError(f"File does not exist: {file_path}")
     
-    if not os.path.isfile(file_path):
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ValidationError(f"Path is not a file: {file_path}")
     
     # Check file extension
-    if not file_path.lower().endswith('.pdf'):
+    if file_path[-4:].lower() != '.pdf':
         raise ValidationError(f"File must be a PDF: {file_path}")
     
     # Check file size (reasonable limit for processing)
-    file_size = os.path.getsize(file_path)
+    file_size = file_stat.st_size
     max_size = 100 * 1024 * 1024  # 100MB limit
     
     if file_size > max_size:
         raise ValidationError(f"File too large: {file_size} bytes (max: {max_size})")
     
-    return True
\ No newline at end of file
+    return True
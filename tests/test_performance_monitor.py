@@ -0,0 +1,112 @@
+import signal
+import time
+import unittest
+
+from src.exceptions import PerformanceError
+from src.utils.performance_monitor import PerformanceMonitor
+
+
+@unittest.skipUnless(hasattr(signal, 'SIGALRM'), "enforce_timeout needs SIGALRM")
+class EnforceTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = PerformanceMonitor()
+
+    def tearDown(self):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+
+    def _install_counting_handler(self):
+        calls = []
+        signal.signal(signal.SIGALRM, lambda signum, frame: calls.append(time.time()))
+        return calls
+
+    def test_raises_after_limit(self):
+        @self.monitor.enforce_timeout(0.2)
+        def slow():
+            time.sleep(2)
+
+        with self.assertRaises(PerformanceError):
+            slow()
+
+    def test_nested_call_keeps_outer_limit(self):
+        @self.monitor.enforce_timeout(0.1)
+        def inner():
+            time.sleep(0.05)
+
+        @self.monitor.enforce_timeout(0.5)
+        def outer():
+            inner()
+            time.sleep(2)
+
+        start = time.time()
+        with self.assertRaisesRegex(PerformanceError, "0.5s"):
+            outer()
+        self.assertLess(time.time() - start, 1.5)
+
+    def test_outer_limit_due_first_interrupts_inner_call(self):
+        @self.monitor.enforce_timeout(5)
+        def inner():
+            time.sleep(2)
+
+        @self.monitor.enforce_timeout(0.2)
+        def outer():
+            inner()
+
+        start = time.time()
+        with self.assertRaisesRegex(PerformanceError, "0.2s"):
+            outer()
+        self.assertLess(time.time() - start, 1.5)
+
+    def test_restores_existing_timer(self):
+        @self.monitor.enforce_timeout(1)
+        def quick():
+            return 42
+
+        signal.setitimer(signal.ITIMER_REAL, 30)
+        self.assertEqual(quick(), 42)
+        remaining, _ = signal.getitimer(signal.ITIMER_REAL)
+        self.assertGreater(remaining, 25)
+
+
+    def test_earlier_non_raising_handler_runs_once_without_timeout(self):
+        calls = self._install_counting_handler()
+
+        @self.monitor.enforce_timeout(0.5)
+        def work():
+            time.sleep(0.3)
+            return 42
+
+        signal.setitimer(signal.ITIMER_REAL, 0.1)
+        self.assertEqual(work(), 42)
+        time.sleep(0.2)
+        self.assertEqual(len(calls), 1)
+
+    def test_limit_still_applies_after_earlier_handler_fires(self):
+        calls = self._install_counting_handler()
+
+        @self.monitor.enforce_timeout(0.4)
+        def slow():
+            time.sleep(2)
+
+        signal.setitimer(signal.ITIMER_REAL, 0.1)
+        start = time.time()
+        with self.assertRaisesRegex(PerformanceError, "0.4s"):
+            slow()
+        self.assertLess(time.time() - start, 1.5)
+        self.assertEqual(len(calls), 1)
+
+    def test_periodic_timer_keeps_its_interval(self):
+        calls = self._install_counting_handler()
+
+        @self.monitor.enforce_timeout(1)
+        def work():
+            time.sleep(0.35)
+
+        signal.setitimer(signal.ITIMER_REAL, 0.1, 0.1)
+        work()
+        self.assertEqual(len(calls), 3)
+        self.assertAlmostEqual(signal.getitimer(signal.ITIMER_REAL)[1], 0.1, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
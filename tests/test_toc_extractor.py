@@ -0,0 +1,39 @@
+import unittest
+
+from src.config import ConfigManager
+from src.services.toc_extractor import TOCExtractor, _DOTTED_NUMBERED_RE
+
+
+class DetectLevelTest(unittest.TestCase):
+    def setUp(self):
+        self.extractor = TOCExtractor(ConfigManager())
+
+    def test_unnumbered_entries_are_h1(self):
+        self.assertEqual(self.extractor.detect_level(None), "H1")
+        self.assertEqual(self.extractor.detect_level(""), "H1")
+
+    def test_one_or_two_dots_are_h2(self):
+        for numpart in ("1.", "2.3", "2.3."):
+            with self.subTest(numpart=numpart):
+                self.assertEqual(self.extractor.detect_level(numpart), "H2")
+
+    def test_three_or_more_dots_are_h3(self):
+        for numpart in ("1.2.3.", "1.2.3.4", "1.2.3.4. "):
+            with self.subTest(numpart=numpart):
+                self.assertEqual(self.extractor.detect_level(numpart), "H3")
+
+    def test_levels_from_toc_lines(self):
+        cases = {
+            "Revision History .......... 3": "H1",
+            "2. Introduction .......... 5": "H2",
+            "2.3 Learning Objectives .......... 7": "H2",
+            "2.3.1. Business Outcomes .......... 8": "H3",
+        }
+        for line, level in cases.items():
+            with self.subTest(line=line):
+                numpart = _DOTTED_NUMBERED_RE.match(line).group(1)
+                self.assertEqual(self.extractor.detect_level(numpart), level)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from src.exceptions import ValidationError
+from src.utils.validation import JSONSchemaValidator, UnicodeHandler
+
+
+class CleanExtractedTextTest(unittest.TestCase):
+    def test_removes_empty_and_dash_parentheses(self):
+        for artifact in ('()', '( )', '(-)', '(---)', '( -- )', '(- -)', '( - - )'):
+            with self.subTest(artifact=artifact):
+                self.assertEqual(UnicodeHandler.clean_extracted_text(f"Intro {artifact} text"), "Intro text")
+
+    def test_keeps_parentheses_with_more_than_two_spaced_dashes(self):
+        for text in ('(- - -)', '(-- -)', '( - -- - )'):
+            with self.subTest(text=text):
+                self.assertEqual(UnicodeHandler.clean_extracted_text(f"Intro {text}"), f"Intro {text}")
+
+    def test_removes_empty_brackets_and_leading_bullet(self):
+        self.assertEqual(UnicodeHandler.clean_extracted_text("• Overview [] {}"), "Overview")
+
+
+class OutputValidationTest(unittest.TestCase):
+    def test_accepts_complete_output(self):
+        self.assertTrue(JSONSchemaValidator.validate_json_output({"title": "Doc", "outline": []}))
+
+    def test_single_missing_field(self):
+        with self.assertRaisesRegex(ValidationError, r"^Missing required field: outline$"):
+            JSONSchemaValidator.validate_json_output({"title": "Doc"})
+
+    def test_several_missing_fields_in_schema_order(self):
+        with self.assertRaisesRegex(ValidationError, r"^Missing required fields: title, outline$"):
+            JSONSchemaValidator.validate_json_output({})
+
+
+class OutlineEntryValidationTest(unittest.TestCase):
+    def _validate_entry(self, entry):
+        JSONSchemaValidator.validate_json_output({"title": "Doc", "outline": [entry]})
+
+    def test_accepts_complete_entry(self):
+        self._validate_entry({"level": "H1", "text": "Intro", "page": 1})
+
+    def test_single_missing_field(self):
+        with self.assertRaisesRegex(ValidationError, r"^Outline entry 0 missing required field: page$"):
+            self._validate_entry({"level": "H1", "text": "Intro"})
+
+    def test_several_missing_fields_in_schema_order(self):
+        with self.assertRaisesRegex(ValidationError, r"^Outline entry 0 missing required fields: level, page$"):
+            self._validate_entry({"text": "Intro"})
+
+    def test_unhashable_level_is_invalid(self):
+        with self.assertRaisesRegex(ValidationError, "has invalid level"):
+            self._validate_entry({"level": ["H1"], "text": "Intro", "page": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()